@@ -0,0 +1,299 @@
+"""Benchmarks the sentiment scoring paths on synthetic headline sets and writes the results as JSON.
+
+Every (path, size) pair runs in a fresh interpreter so that startup cost and peak RSS are
+measured independently. Usage (from the project root):
+    python -m scripts.benchmark_sentiment --sizes 10000,100000,1000000,10000000 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+NEUTRAL_WORDS = [
+    "shares", "stock", "company", "quarter", "earnings", "revenue", "analyst", "price", "target",
+    "report", "market", "sales", "guidance", "investors", "trading", "session", "update", "deal",
+    "announces", "says", "reports", "sees", "q1", "q2", "q3", "q4", "fy", "eps", "vs", "est",
+]
+TICKERS = ["AAPL", "AMZN", "GOOG", "META", "MSFT", "NVDA", "TSLA"]
+# Kept local instead of sampling TextBlob's lexicon so generating data does not warm up the scorers
+SENTIMENT_WORDS = [
+    "strong", "weak", "good", "bad", "great", "poor", "higher", "lower", "best", "worst", "positive",
+    "negative", "solid", "disappointing", "impressive", "terrible", "record", "big", "new", "slow",
+    "not", "very", "really", "surprising", "excellent", "awful", "bullish", "bearish", "safe", "risky",
+]
+
+
+def synthetic_headlines(n, seed=0, duplicate_share=0.2, words_per_headline=(4, 12)):
+    """Builds n headlines mixing neutral words, tickers and sentiment-bearing words.
+
+    About duplicate_share of the rows repeat an earlier headline, as syndicated news does.
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array(NEUTRAL_WORDS * 4 + TICKERS + SENTIMENT_WORDS, dtype=object)
+
+    n_unique = max(1, int(n * (1 - duplicate_share)))
+    lengths = rng.integers(*words_per_headline, size=n_unique)
+    words = pd.DataFrame(rng.choice(vocabulary, size=(n_unique, words_per_headline[1])))
+    unique = words[0].str.cat([words[i].where(lengths > i, "") for i in range(1, words_per_headline[1])], sep=" ")
+    unique = unique.str.strip().str.replace(r"\s+", " ", regex=True).str.capitalize()
+
+    # Duplicates point back to earlier headlines, then rows are shuffled
+    picks = np.concatenate([np.arange(n_unique), rng.integers(0, n_unique, size=n - n_unique)])
+    rng.shuffle(picks)
+    return pd.Series(unique.to_numpy()[picks], name="headline")
+
+
+def _no_close():
+    pass
+
+
+def _textblob_apply(options):
+    from textblob import TextBlob
+    return lambda headlines: headlines.apply(lambda text: TextBlob(text).sentiment.polarity), _no_close
+
+
+def _analyzer_default(options):
+    from src.sentiment_analysis import SentimentReturnAnalyzer
+    return SentimentReturnAnalyzer._score_headlines, _no_close
+
+
+def _engine(options, **kwargs):
+    from src.sentiment_scoring import SentimentEngine
+    engine = SentimentEngine(workers=options["workers"], chunksize=options["chunksize"], **kwargs)
+    # Started here so startup covers every worker, whatever the size of the first batch
+    if engine.workers > 1:
+        engine.start()
+    return engine.polarity, engine.close
+
+
+def _fill_cache(options):
+    # Filled from another interpreter so the measured process starts cold, but with every headline cached
+    path = os.path.join(tempfile.mkdtemp(), "sentiment.sqlite")
+    subprocess.run(
+        [sys.executable, "-m", "scripts.benchmark_sentiment", "--fill-cache", path, str(options["rows"]),
+         "--workers", str(options["workers"]), "--seed", str(options["seed"])],
+        check=True, capture_output=True,
+    )
+    return {"cache_path": path}
+
+
+def _engine_cache_warm(options):
+    from src.sentiment_scoring import SentimentEngine
+    engine = SentimentEngine(workers=options["workers"], cache_path=options["cache_path"])
+    return engine.polarity, engine.close
+
+
+# Headlines where TextBlob's tokenizer joins spaced punctuation into emoticons; the tiered
+# pre-pass must send every one of them to full scoring
+TIERED_EDGE_HEADLINES = [
+    "Morningstar rating: D", "Lowe's: D Grade From Analyst", "Stock X: D", "Group: S Corp",
+    "Series C: P Round", "Shares ( !) rally", "Q3 2018) results", "Rating < 3 stars", "x : - ) y",
+]
+
+
+def _tiered(options):
+    from src.sentiment_analysis import TieredSentimentScorer
+    return TieredSentimentScorer().polarity, _no_close
+
+
+def _check_tiered(options):
+    from src.sentiment_analysis import tiered_mismatches
+    sample = pd.concat([synthetic_headlines(2_000, options["seed"]), pd.Series(TIERED_EDGE_HEADLINES)])
+    mismatches = tiered_mismatches(sample)
+    if len(mismatches):
+        raise AssertionError(f"Tiered scoring differs from TextBlob on: {mismatches['headline'].tolist()[:5]}")
+
+
+def _lexicon(options):
+    from src.sentiment_analysis import LexiconPolarityScorer
+    return LexiconPolarityScorer().polarity, _no_close
+
+
+# Each factory returns a callable scoring a Series of headlines and a callable releasing its
+# resources (worker pools, caches); add new scoring modes here
+PATHS = {
+    "textblob_apply": _textblob_apply,
+    "analyzer_default": _analyzer_default,
+    "engine": lambda options: _engine(options, dedup=False),
+    "engine_dedup": _engine,
+    "engine_cache_warm": _engine_cache_warm,
+    "tiered": _tiered,
+    "lexicon": _lexicon,
+}
+
+# Untimed setup run before a path's startup is measured
+PREPARE = {
+    "engine_cache_warm": _fill_cache,
+}
+
+# Correctness checks run after a path has been measured
+VERIFY = {
+    "tiered": _check_tiered,
+}
+
+
+def _peak_rss_mb(who):
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(who).ru_maxrss * scale / 1024 ** 2
+
+
+def run_one(path, rows, options):
+    """Measures one scoring path in the current (fresh) process."""
+    options = {**options, "rows": rows}
+    if path in PREPARE:
+        options.update(PREPARE[path](options))
+    # Children waited on so far (the PREPARE subprocess) are not part of this path
+    child_rss_baseline = _peak_rss_mb(resource.RUSAGE_CHILDREN)
+    headlines = synthetic_headlines(rows, options["seed"])
+    data_rss = _peak_rss_mb(resource.RUSAGE_SELF)
+
+    start = time.perf_counter()
+    score, close = PATHS[path](options)
+    score(headlines.iloc[:1])
+    startup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    score(headlines)
+    elapsed = time.perf_counter() - start
+    # Pool workers only show up in RUSAGE_CHILDREN once they have exited and been waited on
+    close()
+    if path in VERIFY:
+        VERIFY[path](options)
+    return {
+        "path": path,
+        "rows": rows,
+        "seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else None,
+        "startup_seconds": startup,
+        "data_rss_mb": data_rss,
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "peak_child_rss_mb": max(0.0, _peak_rss_mb(resource.RUSAGE_CHILDREN) - child_rss_baseline),
+    }
+
+
+def cold_start_one(mode, lexicon_path, workers):
+    """Measures how long a scoring worker takes to become warm, in the current (fresh) process.
+
+    mode is "xml" (TextBlob parses its lexicon XML), "pickle" (the compiled artifact is
+    loaded) or "fork" (workers forked from a parent that already loaded the lexicon).
+    """
+    start = time.perf_counter()
+    from src.sentiment_lexicon import cold_start_seconds, preload_lexicon
+    import_seconds = time.perf_counter() - start
+    if mode == "fork":
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        preload_lexicon(lexicon_path)
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            per_worker = list(executor.map(cold_start_seconds, [None] * workers))
+        # Forked workers inherit the imports too
+        import_seconds = 0.0
+    else:
+        per_worker = [cold_start_seconds(lexicon_path if mode == "pickle" else None)]
+    return {"mode": mode, "import_seconds": import_seconds, "lexicon_seconds": max(per_worker)}
+
+
+def measure_cold_start(args):
+    from src.sentiment_lexicon import compile_lexicon
+    lexicon_path = os.path.join(tempfile.mkdtemp(), "lexicon.pkl")
+    compile_lexicon(lexicon_path)
+    results = []
+    for mode in ("xml", "pickle", "fork"):
+        command = [sys.executable, "-m", "scripts.benchmark_sentiment", "--cold-start-one", mode, lexicon_path,
+                   "--workers", str(args.workers)]
+        completed = subprocess.run(command, capture_output=True, text=True, check=True)
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print(f"[Info] Worker cold start ({mode}): import {result['import_seconds']:.3f}s, "
+              f"lexicon + first score {result['lexicon_seconds']:.3f}s")
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000,10000000", help="Comma-separated row counts")
+    parser.add_argument("--paths", default=",".join(PATHS), help="Comma-separated scoring paths")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-budget", type=float, default=1800,
+                        help="Skip larger sizes of a path once its projected run time exceeds this many seconds")
+    parser.add_argument("--output", default="bench_sentiment.json")
+    parser.add_argument("--run-one", nargs=2, metavar=("PATH", "ROWS"), help=argparse.SUPPRESS)
+    parser.add_argument("--fill-cache", nargs=2, metavar=("CACHE_PATH", "ROWS"), help=argparse.SUPPRESS)
+    parser.add_argument("--cold-start-one", nargs=2, metavar=("MODE", "LEXICON_PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    options = {"workers": args.workers, "chunksize": args.chunksize, "seed": args.seed}
+
+    if args.fill_cache:
+        from src.sentiment_scoring import SentimentEngine
+        with SentimentEngine(workers=args.workers, cache_path=args.fill_cache[0]) as engine:
+            engine.polarity(synthetic_headlines(int(args.fill_cache[1]), args.seed))
+        return
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one[0], int(args.run_one[1]), options)))
+        return
+
+    if args.cold_start_one:
+        print(json.dumps(cold_start_one(*args.cold_start_one, args.workers)))
+        return
+
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+    results = []
+    for path in args.paths.split(","):
+        previous = None
+        for rows in sizes:
+            if previous is not None and previous["seconds"] * rows / previous["rows"] > args.time_budget:
+                results.append({"path": path, "rows": rows, "skipped": "projected run time exceeds --time-budget"})
+                print(f"[Info] {path} @ {rows}: skipped (over time budget)")
+                continue
+            command = [
+                sys.executable, "-m", "scripts.benchmark_sentiment", "--run-one", path, str(rows),
+                "--workers", str(args.workers), "--chunksize", str(args.chunksize), "--seed", str(args.seed),
+            ]
+            completed = subprocess.run(command, capture_output=True, text=True)
+            if completed.returncode != 0:
+                results.append({"path": path, "rows": rows, "error": completed.stderr.strip().splitlines()[-1:]})
+                print(f"[Error] {path} @ {rows} failed")
+                continue
+            previous = json.loads(completed.stdout.strip().splitlines()[-1])
+            results.append(previous)
+            print(f"[Info] {path} @ {rows}: {previous['rows_per_second']:,.0f} rows/s, "
+                  f"startup {previous['startup_seconds']:.2f}s, peak RSS {previous['peak_rss_mb']:.0f} MB")
+
+    report = {
+        "commit": _git_commit(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "options": options,
+        "cold_start": measure_cold_start(args),
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[Info] Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
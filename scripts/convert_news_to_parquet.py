@@ -0,0 +1,21 @@
+"""One-time conversion of raw_analyst_ratings.csv into a ticker-partitioned Parquet dataset.
+
+Usage (from the project root):
+    python -m scripts.convert_news_to_parquet data/raw_analyst_ratings.csv data/news_parquet
+"""
+import argparse
+
+from src.news_store import convert_news_to_parquet
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("csv_path", help="Path to the raw news CSV file")
+    parser.add_argument("dataset_path", help="Output directory for the Parquet dataset")
+    parser.add_argument("--chunksize", type=int, default=250_000, help="Rows read per CSV chunk")
+    args = parser.parse_args()
+    convert_news_to_parquet(args.csv_path, args.dataset_path, chunksize=args.chunksize)
+
+
+if __name__ == "__main__":
+    main()
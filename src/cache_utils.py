@@ -0,0 +1,79 @@
+import contextlib
+import hashlib
+import json
+import os
+
+
+def _hash_file(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_files(path):
+    if not os.path.isdir(path):
+        return [path]
+    files = []
+    for root, _, names in os.walk(path):
+        files.extend(os.path.join(root, name) for name in names)
+    return sorted(files)
+
+
+def source_mtime_ns(path):
+    """Latest modification time of a file, or of any file inside a dataset directory."""
+    return max(os.stat(f).st_mtime_ns for f in _source_files(path))
+
+
+def source_digest(path, memo_path=None):
+    """SHA-256 of a file's content (or of every file in a dataset directory).
+
+    When memo_path is given, digests are remembered per file together with its
+    size and mtime, so an unchanged source is not re-hashed on every load.
+    """
+    memo = {}
+    if memo_path is not None and os.path.exists(memo_path):
+        with open(memo_path) as f:
+            memo = json.load(f)
+
+    combined = hashlib.sha256()
+    for file_path in _source_files(path):
+        stat = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        entry = memo.get(key)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": _hash_file(file_path)}
+            memo[key] = entry
+        combined.update(os.path.relpath(file_path, path).encode())
+        combined.update(entry["sha256"].encode())
+
+    if memo_path is not None:
+        with open(memo_path, "w") as f:
+            json.dump(memo, f)
+    return combined.hexdigest()
+
+
+def cache_key(*parts):
+    """Short stable hex key derived from the given parts."""
+    return hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()[:16]
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode="wb"):
+    """Opens a temporary file next to path for writing and moves it over path once the block succeeds.
+
+    A concurrent reader sees either the previous file or the complete new one, never a
+    partial write. Missing parent directories are created.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,254 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import fft, stats
+
+
+def _column_correlation(x, y, min_periods):
+    """Pearson r, pair counts and two-sided p-values of matching columns of x and y, ignoring NaN pairs."""
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=0)
+    count = np.maximum(n, 1)
+    mean_x = np.where(mask, x, 0.0).sum(axis=0) / count
+    mean_y = np.where(mask, y, 0.0).sum(axis=0) / count
+    dx = np.where(mask, x - mean_x, 0.0)
+    dy = np.where(mask, y - mean_y, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+        r = np.clip(r, -1.0, 1.0)
+        dof = n - 2
+        t = r * np.sqrt(dof / (1.0 - r * r))
+        p = 2 * stats.t.sf(np.abs(t), np.maximum(dof, 1))
+
+    # Too few pairs or a constant column leave the correlation undefined
+    undefined = (n < max(min_periods, 3)) | np.isnan(r)
+    r[undefined] = np.nan
+    p[undefined] = np.nan
+    return r, n, p
+
+
+def panel_correlation(sentiment, returns, min_periods=3, block_size=1024):
+    """Correlates each ticker's daily sentiment with its daily returns in one vectorized pass.
+
+    sentiment and returns are wide (dates x tickers) frames; they are aligned on the
+    dates and tickers they share, and missing values drop only the affected pairs.
+    Columns are processed in blocks of block_size tickers to bound memory.
+    Returns a frame indexed by ticker with correlation, n_obs and p_value.
+    """
+    try:
+        sentiment, returns = sentiment.align(returns, join="inner")
+        x = sentiment.to_numpy(dtype=float)
+        y = returns.to_numpy(dtype=float)
+
+        r = np.full(x.shape[1], np.nan)
+        n = np.zeros(x.shape[1], dtype=int)
+        p = np.full(x.shape[1], np.nan)
+        for start in range(0, x.shape[1], block_size):
+            block = slice(start, start + block_size)
+            r[block], n[block], p[block] = _column_correlation(x[:, block], y[:, block], min_periods)
+
+        panel = pd.DataFrame({"correlation": r, "n_obs": n, "p_value": p}, index=sentiment.columns)
+        panel.index.name = "ticker"
+        print(f"[Info] Computed sentiment/return correlations for {len(panel)} tickers "
+              f"({int(panel['correlation'].notna().sum())} with enough observations)")
+        return panel
+    except Exception as e:
+        print(f"[Error] Failed to compute panel correlation: {e}")
+        raise
+
+
+def _window_sums(values, window):
+    """Sum of the last `window` entries at every position, from one cumulative sum."""
+    totals = np.concatenate([[0.0], np.cumsum(values)])
+    ends = np.arange(1, len(values) + 1)
+    return totals[ends] - totals[np.maximum(ends - window, 0)]
+
+
+def rolling_correlation(x, y, windows, min_periods=None):
+    """Rolling Pearson correlation of two aligned series for several window lengths.
+
+    Running sums of x, y, x², y², xy and of the pair count are kept as cumulative sums, so
+    each window costs O(n) no matter its length. Pairs with a NaN on either side are left
+    out of the sums. min_periods defaults to the window length (as in pandas); windows
+    with fewer pairs, or a constant side, are NaN. Returns a frame with one column per window.
+    """
+    index = x.index if isinstance(x, pd.Series) else None
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    mask = ~(np.isnan(x) | np.isnan(y))
+
+    # Centering on the overall means keeps the running sums small and the subtraction below stable
+    if mask.any():
+        x = x - x[mask].mean()
+        y = y - y[mask].mean()
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+
+    columns = {}
+    for window in windows:
+        n = _window_sums(mask.astype(float), window)
+        sx, sy = _window_sums(x, window), _window_sums(y, window)
+        sxx, syy, sxy = _window_sums(x * x, window), _window_sums(y * y, window), _window_sums(x * y, window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = sxy - sx * sy / n
+            var_x = sxx - sx * sx / n
+            var_y = syy - sy * sy / n
+            r = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+        required = window if min_periods is None else min_periods
+        # A constant side leaves only rounding noise in its variance
+        flat = (var_x <= 1e-10 * sxx) | (var_y <= 1e-10 * syy)
+        r[(n < max(required, 2)) | flat] = np.nan
+        columns[f"corr_{window}"] = r
+    return pd.DataFrame(columns, index=index)
+
+
+def _cross_sums(a, b, lags, size):
+    """sum_t a[t] * b[t + lag] for each lag and row, from the spectra of two (tickers x time) arrays."""
+    circular = fft.irfft(np.conj(a) * b, size, axis=-1, workers=-1)
+    # Negative lags wrap around to the end of the circular result
+    return circular[:, np.asarray(lags) % size].T
+
+
+def _lag_block(x, y, lags, min_periods):
+    """Lag x ticker correlations of the columns of x and y, ignoring NaN pairs at each lag."""
+    mx = (~np.isnan(x)).astype(float)
+    my = (~np.isnan(y)).astype(float)
+    x = np.where(mx > 0, x, 0.0)
+    y = np.where(my > 0, y, 0.0)
+    x = np.where(mx > 0, x - x.sum(axis=0) / np.maximum(mx.sum(axis=0), 1), 0.0)
+    y = np.where(my > 0, y - y.sum(axis=0) / np.maximum(my.sum(axis=0), 1), 0.0)
+
+    # Padding to len(x) + the widest lag with any overlap keeps every requested lag from
+    # wrapping onto another one; lags without overlap are set to NaN below
+    lags = np.asarray(lags)
+    reach = min(int(np.abs(lags).max()) if len(lags) else 0, max(len(x) - 1, 0))
+    size = fft.next_fast_len(max(len(x), 1) + reach)
+    # Tickers on the last axis of contiguous rows make every transform a fast batch
+    fx, fy, fmx, fmy, fxx, fyy = (
+        fft.rfft(np.ascontiguousarray(values.T), size, axis=-1, workers=-1)
+        for values in (x, y, mx, my, x * x, y * y)
+    )
+    n = np.rint(_cross_sums(fmx, fmy, lags, size))
+    sx = _cross_sums(fx, fmy, lags, size)
+    sy = _cross_sums(fmx, fy, lags, size)
+    sxx = _cross_sums(fxx, fmy, lags, size)
+    syy = _cross_sums(fmx, fyy, lags, size)
+    sxy = _cross_sums(fx, fy, lags, size)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = np.clip((sxy - sx * sy / n) / np.sqrt(var_x * var_y), -1.0, 1.0)
+    # FFT rounding leaves tiny non-zero variances for constant overlaps
+    r[(n < max(min_periods, 3)) | (var_x <= 1e-10 * sxx) | (var_y <= 1e-10 * syy)] = np.nan
+    r[np.abs(lags) >= len(x)] = np.nan
+    return r
+
+
+def lag_correlation(sentiment, returns, max_lag=10, min_lag=None, min_periods=3, block_size=256):
+    """Correlation of sentiment with returns `lag` rows later, for every lag in [min_lag, max_lag].
+
+    sentiment and returns are wide (sessions x tickers) frames, or two Series, on the same
+    consecutive trading sessions (a missing day should be a NaN row, not a dropped row).
+    A positive lag means sentiment leads returns. Every lag of every ticker comes out of the
+    same six FFT cross-correlations (of x, y, x², y² and their NaN masks), so the cost does
+    not grow with the width of the sweep; NaN pairs are excluded at each lag.
+    min_lag defaults to -max_lag; tickers are transformed block_size at a time to bound memory.
+    Returns a frame indexed by lag with one column per ticker.
+    """
+    try:
+        if isinstance(sentiment, pd.Series):
+            name = sentiment.name if sentiment.name is not None else "correlation"
+            sentiment, returns = sentiment.to_frame(name), returns.to_frame(name)
+        sentiment, returns = sentiment.align(returns, join="inner")
+        lags = np.arange(-max_lag if min_lag is None else min_lag, max_lag + 1)
+
+        x = sentiment.to_numpy(dtype=float)
+        y = returns.to_numpy(dtype=float)
+        r = np.full((len(lags), x.shape[1]), np.nan)
+        for start in range(0, x.shape[1], block_size):
+            block = slice(start, start + block_size)
+            r[:, block] = _lag_block(x[:, block], y[:, block], lags, min_periods)
+
+        profile = pd.DataFrame(r, index=pd.Index(lags, name="lag"), columns=sentiment.columns)
+        print(f"[Info] Computed lead/lag correlations for {profile.shape[1]} tickers over lags "
+              f"{lags[0]}..{lags[-1]}")
+        return profile
+    except Exception as e:
+        print(f"[Error] Failed to compute lag correlation: {e}")
+        raise
+
+
+def bootstrap_indices(rng, n, n_resamples, block_length=None):
+    """(n_resamples x n) matrix of resampled positions, drawn in one call.
+
+    With block_length, runs of consecutive positions starting at random points are
+    concatenated (moving block bootstrap), which keeps short-range autocorrelation.
+    """
+    if block_length is None or block_length <= 1:
+        return rng.integers(0, n, size=(n_resamples, n))
+    block_length = min(block_length, n)
+    n_blocks = -(-n // block_length)
+    starts = rng.integers(0, n - block_length + 1, size=(n_resamples, n_blocks, 1))
+    return (starts + np.arange(block_length)).reshape(n_resamples, -1)[:, :n]
+
+
+def _bootstrap_batch(x, y, n_resamples, block_length, seed):
+    """Correlations of n_resamples resamples of the (x, y) positions, each ignoring its NaN pairs."""
+    index = bootstrap_indices(np.random.default_rng(seed), len(x), n_resamples, block_length)
+    r, _, _ = _column_correlation(x[index].T, y[index].T, min_periods=3)
+    return r
+
+
+def bootstrap_correlation(x, y, n_resamples=2000, confidence=0.95, block_length=None, seed=None,
+                          workers=None, batch_size=500):
+    """Percentile bootstrap confidence interval of the Pearson correlation of x and y.
+
+    Positions are resampled as they are, NaN pairs included, so blocks span consecutive
+    observations (e.g. trading sessions with and without news); each resample then drops
+    its NaN pairs. Resamples are drawn batch_size at a time as one index matrix; with
+    workers > 1 the batches are spread over a process pool. Each batch has its own seed
+    derived from seed, so the interval does not depend on the number of workers.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    if len(valid) < 3:
+        raise ValueError(f"Need at least 3 complete pairs for a bootstrap, got {len(valid)}")
+    # Leading and trailing positions without a complete pair would only dilute the blocks
+    x, y = x[valid[0]:valid[-1] + 1], y[valid[0]:valid[-1] + 1]
+
+    sizes = [min(batch_size, n_resamples - start) for start in range(0, n_resamples, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = ([x] * len(sizes), [y] * len(sizes), sizes, [block_length] * len(sizes), seeds)
+    if workers is not None and workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            samples = np.concatenate(list(executor.map(_bootstrap_batch, *arguments)))
+    else:
+        samples = np.concatenate(list(map(_bootstrap_batch, *arguments)))
+    correlation, n_obs, _ = _column_correlation(x[:, None], y[:, None], min_periods=3)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.nanquantile(samples, [alpha, 1 - alpha])
+    return {
+        "correlation": float(correlation[0]),
+        "ci_low": float(low),
+        "ci_high": float(high),
+        "std_error": float(np.nanstd(samples, ddof=1)),
+        "confidence": confidence,
+        "n_resamples": n_resamples,
+        "block_length": block_length,
+        "n_obs": int(n_obs[0]),
+    }
+
+
+def panel_from_analyzers(analyzers):
+    """Builds wide (dates x tickers) sentiment and return frames from merged SentimentReturnAnalyzers."""
+    sentiment, returns = {}, {}
+    for symbol, analyzer in analyzers.items():
+        daily = analyzer.merged_df.groupby("date")[["sentiment", "daily_return"]].mean()
+        sentiment[symbol] = daily["sentiment"]
+        returns[symbol] = daily["daily_return"]
+    return pd.DataFrame(sentiment).sort_index(), pd.DataFrame(returns).sort_index()
@@ -0,0 +1,57 @@
+import pandas as pd
+
+from src.dedup import UniqueCounter, map_unique
+
+
+# Trailing UTC offsets ("-04:00", "+0000", "Z") are dropped so every row keeps its wall-clock time
+UTC_OFFSET_PATTERN = r"(?:Z|[+-]\d{2}:?\d{2})$"
+
+# (name, detection pattern, format passed to pd.to_datetime), tried in order
+NEWS_DATE_FORMATS = [
+    ("iso", r"^\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?$", "ISO8601"),
+    ("us_12h", r"^\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2} [AaPp][Mm]$", "%m/%d/%Y %I:%M:%S %p"),
+]
+
+# Shared across analyzers so the savings of every memoized parse can be inspected in one place
+date_parse_counter = UniqueCounter("news dates")
+
+
+def clean_date_strings(values):
+    """Strips surrounding whitespace and collapses repeated spaces in date strings."""
+    return (
+        values
+        .astype(str)
+        .str.strip()
+        .str.replace(r"\s{2,}", " ", regex=True)
+    )
+
+
+def parse_news_dates(values):
+    """Parses mixed-format news date strings into naive wall-clock timestamps.
+
+    Each row's format is detected with a regular expression and every format
+    group is parsed in a single pd.to_datetime call. Rows matching none of the
+    known formats fall back to pandas' own format inference.
+
+    Unlike the former whole-column parse, ISO rows without an offset are not lost
+    when other rows carry one, so fewer dates end up NaT than before.
+    """
+    text = clean_date_strings(values).str.replace(UTC_OFFSET_PATTERN, "", regex=True)
+    parsed = pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]", name=values.name)
+    remaining = pd.Series(True, index=text.index)
+
+    for _, pattern, fmt in NEWS_DATE_FORMATS:
+        mask = remaining & text.str.match(pattern)
+        if mask.any():
+            parsed[mask] = pd.to_datetime(text[mask], format=fmt, errors="coerce")
+        remaining &= ~mask
+
+    if remaining.any():
+        fallback = pd.to_datetime(text[remaining], format="mixed", errors="coerce", utc=True)
+        parsed[remaining] = fallback.dt.tz_localize(None)
+    return parsed
+
+
+def parse_news_dates_memoized(values, counter=date_parse_counter):
+    """Runs parse_news_dates on each distinct date string once and broadcasts the results."""
+    return map_unique(values, parse_news_dates, counter)
@@ -0,0 +1,55 @@
+import pandas as pd
+
+
+class UniqueCounter:
+    """
+    Tracks how many values were seen versus how many distinct values were actually computed.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def __repr__(self):
+        return f"<UniqueCounter {self.name} unique={self.unique} total={self.total} ratio={self.ratio:.3f}>"
+
+    def reset(self):
+        """Clears the accumulated counts."""
+        self.total = 0
+        self.unique = 0
+        self.last_total = 0
+        self.last_unique = 0
+
+    def record(self, total, unique):
+        """Adds the counts of one call."""
+        self.total += total
+        self.unique += unique
+        self.last_total = total
+        self.last_unique = unique
+
+    @property
+    def ratio(self):
+        """Unique-to-total ratio over every recorded call; lower means more work saved."""
+        return self.unique / self.total if self.total else 0.0
+
+    @property
+    def last_ratio(self):
+        """Unique-to-total ratio of the most recent call only."""
+        return self.last_unique / self.last_total if self.last_total else 0.0
+
+
+def map_unique(values, func, counter=None):
+    """Applies a vectorized func to the distinct values only and broadcasts the results back.
+
+    The values are factorized into integer codes, func receives a Series of the
+    uniques (missing values included once) and returns a Series or DataFrame of
+    the same length, which is then expanded through the codes.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    if counter is not None:
+        counter.record(len(codes), len(uniques))
+
+    results = func(pd.Series(uniques, name=values.name))
+    if not isinstance(results, (pd.Series, pd.DataFrame)):
+        results = pd.Series(results, name=values.name)
+    return results.reset_index(drop=True).take(codes).set_axis(values.index)
@@ -1,23 +1,37 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-import re
+from pandas.api.types import is_datetime64_any_dtype
 from sklearn.feature_extraction.text import CountVectorizer
 import nltk
 from nltk.corpus import stopwords
 
+from src.date_parsing import date_parse_counter
+from src.dedup import map_unique
+from src.news_store import DERIVED_DTYPES, chunksize_for_memory, is_parquet_dataset, load_news
+
 class EdaAnalysis:
-    def __init__(self, input_path, selected_stocks=None):
+    def __init__(self, input_path, selected_stocks=None, columns=None,
+                 chunksize=None, max_memory_mb=None):
         self.input_path = input_path
         self.selected_stocks = selected_stocks
+        self.columns = columns
+        self.chunksize = chunksize
+        self.max_memory_mb = max_memory_mb
         self.df = pd.DataFrame()
 
+    def _resolve_chunksize(self):
+        # A memory ceiling takes precedence over a fixed chunk size
+        if self.max_memory_mb is not None and not is_parquet_dataset(self.input_path):
+            return chunksize_for_memory(self.input_path, self.max_memory_mb, self.columns)
+        return self.chunksize
+
     def load_data(self):
         try:
-            self.df = pd.read_csv(self.input_path)
-            print("File loaded successfully. Shape:", self.df.shape)
-
-            self.df = self.df[self.df['stock'].isin(self.selected_stocks)]
+            # Parquet datasets only read the partitions of the selected stocks,
+            # CSV files are streamed in chunks when a chunk size or memory ceiling is set
+            chunksize = self._resolve_chunksize()
+            self.df = load_news(self.input_path, self.selected_stocks, self.columns, chunksize)
             print(f"Filtered DataFrame shape of {self.selected_stocks}:", self.df.shape)
         except FileNotFoundError:
             print("File not found. Check the relative path.")
@@ -41,7 +55,7 @@ class EdaAnalysis:
         print(self.df.isna().sum())
 
     def analyze_headline_lengths(self):
-        self.df['headline_length'] = self.df['headline'].apply(len)
+        self.df['headline_length'] = self.df['headline'].str.len().astype(DERIVED_DTYPES['headline_length'])
         print("\nHeadline length statistics:")
         print(self.df['headline_length'].describe())
     
@@ -65,15 +79,21 @@ class EdaAnalysis:
         plt.show()
 
     def parse_dates(self):
-        self.df['date'] = pd.to_datetime(self.df['date'], errors='coerce', utc=True)
+        # An already parsed column is reused; parsing it again would only inflate the counter
+        if not is_datetime64_any_dtype(self.df['date']):
+            # Each distinct timestamp string is parsed once and broadcast back through its code
+            self.df['date'] = map_unique(
+                self.df['date'],
+                lambda dates: pd.to_datetime(dates, errors='coerce', utc=True),
+                date_parse_counter,
+            )
+            print(f"Date parsing: {date_parse_counter.last_unique} unique of {date_parse_counter.last_total} values "
+                  f"(ratio {date_parse_counter.last_ratio:.3f})")
         self.df['date_only'] = self.df['date'].dt.date
 
     def daily_article_trend(self):
-        # Ensure 'date' column is in datetime format
-        self.df['date'] = pd.to_datetime(self.df['date'], errors='coerce', utc=True)
-
-        # Extract only date part (YYYY-MM-DD)
-        self.df['date_only'] = self.df['date'].dt.date
+        # Ensure 'date' column is in datetime format and extract only date part (YYYY-MM-DD)
+        self.parse_dates()
 
         # Count articles published per day
         daily_counts = self.df.groupby('date_only').size()
@@ -87,7 +107,7 @@ class EdaAnalysis:
         plt.show()
 
     def article_hour_distribution(self):
-        self.df['hour'] = self.df['date'].dt.hour
+        self.df['hour'] = self.df['date'].dt.hour.astype(DERIVED_DTYPES['hour'])
         hourly_counts = self.df['hour'].value_counts().sort_index()
         plt.figure(figsize=(10, 5))
         hourly_counts.plot(kind='bar', title="⏰ Article Publication by Hour of Day", color='skyblue')
@@ -112,9 +132,11 @@ class EdaAnalysis:
         plt.show()
 
     def extract_email_domains(self):
-        self.df['publisher_domain'] = self.df['publisher'].apply(
-            lambda pub: re.search(r'@([A-Za-z0-9.-]+\.[A-Za-z]{2,})', str(pub)).group(1)
-            if re.search(r'@([A-Za-z0-9.-]+\.[A-Za-z]{2,})', str(pub)) else None
+        self.df['publisher_domain'] = (
+            self.df['publisher']
+            .astype(str)
+            .str.extract(r'@([A-Za-z0-9.-]+\.[A-Za-z]{2,})', expand=False)
+            .astype(DERIVED_DTYPES['publisher_domain'])
         )
         email_domains = self.df['publisher_domain'].dropna()
         domain_counts = email_domains.value_counts()
@@ -0,0 +1,193 @@
+import glob
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from src.cache_utils import atomic_write, cache_key, source_digest, source_mtime_ns
+from src.news_store import NEWS_DTYPES, concat_news
+
+# Part of every cache key; frames cleaned under another version are never reused
+NEWS_CACHE_VERSION = 1
+
+
+def _read_frame(path):
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True).set_index("__index__").rename_axis(None)
+
+
+def _write_frame(df, path):
+    table = pa.Table.from_pandas(df.rename_axis("__index__").reset_index(), preserve_index=False)
+    with atomic_write(path) as f:
+        feather.write_feather(table, f, compression="uncompressed")
+
+
+class NewsFrameCache:
+    """
+    Stores cleaned per-symbol news frames as uncompressed Feather files that can be memory-mapped.
+
+    Files are keyed by the source's content hash, its mtime, the symbol and the selected
+    columns, so editing the news file automatically invalidates its cached frames.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._digest_memo = os.path.join(cache_dir, "source_digests.json")
+
+    def path_for(self, source_path, symbol, columns=None):
+        """Returns the cache file path of the cleaned frame for symbol."""
+        key = cache_key(
+            NEWS_CACHE_VERSION,
+            source_digest(source_path, self._digest_memo),
+            source_mtime_ns(source_path),
+            symbol,
+            sorted(columns) if columns is not None else None,
+        )
+        return os.path.join(self.cache_dir, f"{symbol}-{key}.feather")
+
+    def load(self, source_path, symbol, columns=None):
+        """Maps the cached frame for symbol, or returns None if there is no valid entry."""
+        path = self.path_for(source_path, symbol, columns)
+        if not os.path.exists(path):
+            return None
+        return _read_frame(path)
+
+    def store(self, df, source_path, symbol, columns=None):
+        """Writes the cleaned frame for symbol, replacing any other entry of that symbol."""
+        path = self.path_for(source_path, symbol, columns)
+        for stale in glob.glob(os.path.join(self.cache_dir, f"{glob.escape(symbol)}-*.feather")):
+            # Segments of IncrementalNewsCache share the directory and are not ours to remove
+            if stale != path and ".seg-" not in stale:
+                os.remove(stale)
+        _write_frame(df, path)
+        return path
+
+
+class IncrementalNewsCache:
+    """
+    Keeps a cleaned per-symbol news frame in sync with an append-only news CSV.
+
+    A checkpoint records the byte offset and row count parsed so far plus digests of the
+    file's first bytes and of the bytes just before the offset. The next load parses only
+    the tail after the offset and appends its cleaned rows as a new Feather segment, so a
+    refresh costs time proportional to the new rows. The frame is rebuilt from scratch if
+    the file shrank or either digested range changed; edits to already ingested rows
+    between those two ranges are not detected, so the file must only ever be appended to.
+    """
+
+    HEAD_BYTES = 1 << 16
+    BOUNDARY_BYTES = 1 << 12
+    # Segments are merged into one file once there are more than this many
+    MAX_SEGMENTS = 32
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _base_path(self, source_path, symbol, columns):
+        key = cache_key(
+            NEWS_CACHE_VERSION,
+            os.path.abspath(source_path),
+            symbol,
+            sorted(columns) if columns is not None else None,
+        )
+        return os.path.join(self.cache_dir, f"{symbol}-{key}")
+
+    @staticmethod
+    def _digest(f, start, stop):
+        f.seek(start)
+        return hashlib.sha256(f.read(stop - start)).hexdigest()
+
+    def _checkpoint_is_valid(self, source_path, checkpoint):
+        offset = checkpoint["offset"]
+        if os.path.getsize(source_path) < offset:
+            return False
+        with open(source_path, "rb") as f:
+            return (
+                self._digest(f, 0, min(offset, self.HEAD_BYTES)) == checkpoint["head_digest"]
+                and self._digest(f, max(0, offset - self.BOUNDARY_BYTES), offset) == checkpoint["boundary_digest"]
+            )
+
+    @staticmethod
+    def _read_rows(source_path, start, header, first_row, columns):
+        """Parses the complete lines after byte offset start and returns them with the new offset."""
+        with open(source_path, "rb") as f:
+            f.seek(start)
+            data = f.read()
+        # A line still being written has no trailing newline yet and is left for the next run
+        data = data[:data.rfind(b"\n") + 1]
+        if start == 0:
+            rows = pd.read_csv(io.BytesIO(data), usecols=columns, dtype=NEWS_DTYPES)
+        elif data:
+            rows = pd.read_csv(io.BytesIO(data), header=None, names=header, usecols=columns, dtype=NEWS_DTYPES)
+        else:
+            rows = pd.DataFrame(columns=columns if columns is not None else header)
+        rows.index = pd.RangeIndex(first_row, first_row + len(rows))
+        return rows, start + len(data)
+
+    def _write_checkpoint(self, base, source_path, checkpoint):
+        with open(source_path, "rb") as f:
+            offset = checkpoint["offset"]
+            checkpoint["head_digest"] = self._digest(f, 0, min(offset, self.HEAD_BYTES))
+            checkpoint["boundary_digest"] = self._digest(f, max(0, offset - self.BOUNDARY_BYTES), offset)
+        with atomic_write(base + ".checkpoint.json", "w") as f:
+            json.dump(checkpoint, f)
+
+    def load(self, source_path, symbol, clean, columns=None):
+        """Returns the cleaned frame for symbol, ingesting only rows appended since the last call.
+
+        clean receives the raw rows (with their CSV row numbers as index) and returns the
+        cleaned rows of the symbol.
+        """
+        if columns is not None and "stock" not in columns:
+            columns = list(columns) + ["stock"]
+        base = self._base_path(source_path, symbol, columns)
+        checkpoint = None
+        if os.path.exists(base + ".checkpoint.json"):
+            with open(base + ".checkpoint.json") as f:
+                checkpoint = json.load(f)
+            if not self._checkpoint_is_valid(source_path, checkpoint):
+                print("[Info] News file head or checkpoint boundary changed; rebuilding the cleaned frame")
+                checkpoint = None
+
+        if checkpoint is None:
+            for stale in glob.glob(glob.escape(base) + ".seg-*.feather"):
+                os.remove(stale)
+            header = pd.read_csv(source_path, nrows=0).columns.tolist()
+            checkpoint = {"offset": 0, "rows": 0, "header": header, "segments": [], "next_segment": 0}
+
+        raw, offset = self._read_rows(
+            source_path, checkpoint["offset"], checkpoint["header"], checkpoint["rows"], columns
+        )
+        print(f"[Info] Ingested {len(raw)} new news rows from byte offset {checkpoint['offset']}")
+        segments = [_read_frame(path) for path in checkpoint["segments"]]
+        if len(raw):
+            cleaned = clean(raw)
+            segment_path = f"{base}.seg-{checkpoint['next_segment']:05d}.feather"
+            _write_frame(cleaned, segment_path)
+            checkpoint["segments"].append(segment_path)
+            checkpoint["next_segment"] += 1
+            segments.append(cleaned)
+
+        if segments:
+            news_df = concat_news(segments)
+        else:
+            news_df = clean(raw)
+
+        if len(checkpoint["segments"]) > self.MAX_SEGMENTS:
+            compacted_path = f"{base}.seg-{checkpoint['next_segment']:05d}.feather"
+            _write_frame(news_df, compacted_path)
+            for path in checkpoint["segments"]:
+                os.remove(path)
+            checkpoint["segments"] = [compacted_path]
+            checkpoint["next_segment"] += 1
+
+        checkpoint["offset"] = offset
+        checkpoint["rows"] += len(raw)
+        self._write_checkpoint(base, source_path, checkpoint)
+        return news_df
@@ -0,0 +1,174 @@
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+# Read-time dtypes of the raw news columns: low-cardinality labels become categoricals,
+# free text is stored as Arrow-backed strings instead of Python objects
+NEWS_DTYPES = {
+    "Unnamed: 0": "int32",
+    "headline": "string[pyarrow]",
+    "url": "string[pyarrow]",
+    "publisher": "category",
+    "date": "string[pyarrow]",
+    "stock": "category",
+}
+
+# Dtypes of the columns the analyzers derive from the raw news
+DERIVED_DTYPES = {
+    "publisher_domain": "category",
+    "headline_length": "int32",
+    "hour": "float32",
+}
+
+
+def _news_arrow_schema(columns):
+    """One Arrow schema for every chunk, so a column that is empty in some chunk keeps its type."""
+    return pa.schema([
+        (col, pa.int32() if NEWS_DTYPES.get(col) == "int32" else pa.string())
+        for col in columns
+    ])
+
+
+def convert_news_to_parquet(csv_path, dataset_path, chunksize=250_000):
+    """Writes the news CSV into a Parquet dataset partitioned by ticker.
+
+    The dataset is built in a temporary sibling directory and then replaces dataset_path,
+    so re-running the conversion never leaves files of an earlier run behind.
+    """
+    staging_path = f"{os.path.normpath(dataset_path)}.tmp-{os.getpid()}"
+    shutil.rmtree(staging_path, ignore_errors=True)
+    total_rows = 0
+    try:
+        columns = pd.read_csv(csv_path, nrows=0).columns
+        schema = _news_arrow_schema(columns)
+        read_dtypes = {col: "int32" if schema.field(col).type == pa.int32() else "string" for col in columns}
+        for i, chunk in enumerate(pd.read_csv(csv_path, dtype=read_dtypes, chunksize=chunksize)):
+            chunk = chunk.dropna(subset=["stock"])
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            pq.write_to_dataset(
+                table,
+                root_path=staging_path,
+                partition_cols=["stock"],
+                basename_template=f"part-{i:05d}-{{i}}.parquet",
+            )
+            total_rows += len(chunk)
+        os.makedirs(staging_path, exist_ok=True)
+        if os.path.exists(dataset_path):
+            shutil.rmtree(dataset_path)
+        os.replace(staging_path, dataset_path)
+    except Exception:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+    print(f"[Info] Wrote {total_rows} rows to partitioned dataset at {dataset_path}")
+    return dataset_path
+
+
+def apply_news_dtypes(df):
+    """Casts the known news columns of df to the compact schema."""
+    schema = {**NEWS_DTYPES, **DERIVED_DTYPES}
+    df = df.astype({
+        col: dtype for col, dtype in schema.items()
+        # Already parsed dates are left alone
+        if col in df.columns and not is_datetime64_any_dtype(df[col])
+    })
+    # Filtering leaves categories of other tickers/publishers behind, which would show up in value_counts()
+    for col in df.select_dtypes("category").columns:
+        df[col] = df[col].cat.remove_unused_categories()
+    return df
+
+
+def concat_news(frames):
+    """Concatenates news frames, re-applying the compact schema.
+
+    Each frame carries its own categories, which pd.concat would otherwise widen to object.
+    """
+    return apply_news_dtypes(pd.concat(frames))
+
+
+def dtype_memory_report(df):
+    """Compares the deep memory usage of df with default dtypes against the compact schema."""
+    default_dtypes = {
+        col: df[col].dtype if is_datetime64_any_dtype(df[col])
+        else "int64" if df[col].dtype.kind in "iu"
+        else "float64" if is_numeric_dtype(df[col])
+        else object
+        for col in df.columns
+    }
+    before = df.astype(default_dtypes).memory_usage(deep=True, index=False)
+    after = apply_news_dtypes(df).memory_usage(deep=True, index=False)
+    report = pd.DataFrame({"bytes_before": before, "bytes_after": after})
+    report.loc["total"] = report.sum()
+    report["saved_pct"] = (1 - report["bytes_after"] / report["bytes_before"]).mul(100).round(1)
+    print(f"[Info] News frame memory: {report.at['total', 'bytes_before']:,} -> "
+          f"{report.at['total', 'bytes_after']:,} bytes")
+    return report
+
+
+def is_parquet_dataset(path):
+    """Returns True if the path points to a Parquet dataset directory."""
+    return os.path.isdir(path)
+
+
+def iter_news_chunks(path, stocks=None, columns=None, chunksize=100_000):
+    """Yields the filtered rows of each bounded CSV chunk (or Parquet batch), skipping empty chunks."""
+    if columns is not None and "stock" not in columns:
+        columns = list(columns) + ["stock"]
+
+    if is_parquet_dataset(path):
+        dataset = ds.dataset(path, partitioning="hive")
+        row_filter = ds.field("stock").isin(list(stocks)) if stocks is not None else None
+        for batch in dataset.to_batches(columns=columns, filter=row_filter, batch_size=chunksize):
+            if batch.num_rows:
+                yield apply_news_dtypes(batch.to_pandas())
+        return
+
+    for chunk in pd.read_csv(path, usecols=columns, dtype=NEWS_DTYPES, chunksize=chunksize):
+        if stocks is not None:
+            chunk = chunk[chunk["stock"].isin(stocks)]
+        if not chunk.empty:
+            yield chunk
+
+
+def read_news_csv_chunked(path, stocks=None, columns=None, chunksize=100_000):
+    """Reads the news CSV chunk by chunk, keeping only the rows of the given tickers."""
+    survivors = list(iter_news_chunks(path, stocks, columns, chunksize))
+    if not survivors:
+        return pd.read_csv(path, usecols=columns, dtype=NEWS_DTYPES, nrows=0)
+    return concat_news(survivors)
+
+
+def chunksize_for_memory(path, max_memory_mb, columns=None, sample_rows=10_000):
+    """Estimates how many CSV rows fit in the given memory budget from a sample."""
+    sample = pd.read_csv(path, usecols=columns, nrows=sample_rows)
+    if sample.empty:
+        return sample_rows
+    bytes_per_row = sample.memory_usage(deep=True).sum() / len(sample)
+    return max(1, int(max_memory_mb * 1024 ** 2 / bytes_per_row))
+
+
+def load_news(path, stocks=None, columns=None, chunksize=None):
+    """Loads news rows for the given tickers from a Parquet dataset or a CSV file.
+
+    Only the partitions of the requested tickers are read from a Parquet dataset.
+    A CSV file is parsed in full and filtered afterwards, or filtered chunk by
+    chunk when a chunksize is given.
+    """
+    if columns is not None and "stock" not in columns:
+        columns = list(columns) + ["stock"]
+
+    if is_parquet_dataset(path):
+        filters = [("stock", "in", list(stocks))] if stocks is not None else None
+        return apply_news_dtypes(pd.read_parquet(path, columns=columns, filters=filters))
+
+    if chunksize is not None:
+        return read_news_csv_chunked(path, stocks, columns, chunksize)
+
+    df = pd.read_csv(path, usecols=columns, dtype=NEWS_DTYPES)
+    if stocks is not None:
+        df = df[df["stock"].isin(stocks)]
+    return apply_news_dtypes(df)
@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.cache_utils import atomic_write, cache_key
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+# Arrays written under another version are rebuilt from the CSV
+PRICE_CACHE_VERSION = 1
+
+
+def load_price_csv(filepath):
+    """Parses a *_historical_data.csv file into a Date-indexed frame with numeric OHLCV columns."""
+    df = pd.read_csv(filepath)
+    df['Date'] = pd.to_datetime(df['Date'])
+    df.set_index('Date', inplace=True)
+
+    # Ensure numeric types
+    for col in PRICE_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+class PriceCache:
+    """
+    Keeps each ticker's cleaned price history as typed NumPy arrays in an .npz file.
+
+    An entry records the size and mtime of the CSV it was built from and is rebuilt
+    from the CSV when either changes. Only numeric columns are cached.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path_for(self, filepath):
+        """Returns the .npz path caching the given CSV."""
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        return os.path.join(self.cache_dir, f"{stem}-{cache_key(os.path.abspath(filepath))}.npz")
+
+    def load(self, filepath, columns=None):
+        """Returns the cleaned price frame, re-parsing the CSV only when the cache is stale.
+
+        When columns is given, only those arrays are read from the cache file.
+        """
+        path = self.path_for(filepath)
+        stat = os.stat(filepath)
+        if os.path.exists(path):
+            with np.load(path, allow_pickle=False) as data:
+                if (int(data['version']) == PRICE_CACHE_VERSION
+                        and int(data['source_size']) == stat.st_size
+                        and int(data['source_mtime_ns']) == stat.st_mtime_ns):
+                    return self._to_frame(data, columns)
+
+        df = load_price_csv(filepath).select_dtypes('number')
+        self._store(df, path, stat)
+        return df if columns is None else df[columns]
+
+    @staticmethod
+    def _to_frame(data, columns=None):
+        stored = data['columns'].tolist()
+        wanted = stored if columns is None else columns
+        index = pd.DatetimeIndex(data['index'], name='Date')
+        # np.load is lazy, so only the requested arrays are read
+        return pd.DataFrame({col: data[f'col_{stored.index(col)}'] for col in wanted}, index=index)
+
+    @staticmethod
+    def _store(df, path, stat):
+        arrays = {f'col_{i}': df[col].to_numpy() for i, col in enumerate(df.columns)}
+        with atomic_write(path) as f:
+            np.savez(
+                f,
+                version=PRICE_CACHE_VERSION,
+                source_size=stat.st_size,
+                source_mtime_ns=stat.st_mtime_ns,
+                index=df.index.to_numpy(),
+                columns=np.array(df.columns, dtype=str),
+                **arrays,
+            )
@@ -4,23 +4,23 @@ import talib
 import numpy as np
 import pynance as pn
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from src.price_cache import PriceCache, load_price_csv
 
 class StockAnalyzer:
-    def __init__(self, name, filepath):
+    def __init__(self, name, filepath, cache_dir=None):
         self.filepath = filepath
         self.name = name
+        self.cache = PriceCache(cache_dir) if cache_dir is not None else None
         self.df = None
 
     def load_data(self):
         try:
-            self.df = pd.read_csv(self.filepath)
-            self.df['Date'] = pd.to_datetime(self.df['Date'])
-            self.df.set_index('Date', inplace=True)
-
-            # Ensure numeric types
-            for col in ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+            if self.cache is not None:
+                self.df = self.cache.load(self.filepath)
+            else:
+                self.df = load_price_csv(self.filepath)
             print("Data loaded successfully.")
         except Exception as e:
             print(f"[Error] Failed to load data: {e}")
@@ -94,23 +94,48 @@ class StockAnalyzer:
             print(f"[Error] Failed to plot daily return: {e}")
 
 
+def load_close_prices(ticker, filepath, cache_dir=None):
+    """Reads only the Date and Close columns of one ticker."""
+    try:
+        if cache_dir is not None:
+            close = PriceCache(cache_dir).load(filepath, columns=['Close'])['Close']
+        else:
+            close = pd.read_csv(filepath, usecols=["Date", "Close"], parse_dates=["Date"], index_col="Date")['Close']
+        return ticker, close.rename(ticker), None
+    except Exception as e:
+        return ticker, None, e
+
+
 class PortfolioAnalyzer:
-    def __init__(self, ticker_file_map):
+    def __init__(self, ticker_file_map, cache_dir=None):
         self.ticker_file_map = ticker_file_map
+        self.cache_dir = cache_dir
         self.data = {}
 
-    def load_data(self):
+    def load_data(self, max_workers=None, use_processes=False):
         print("Fetching data from CSV files...")
-        for ticker, filepath in self.ticker_file_map.items():
-            try:
-                df = pd.read_csv(filepath, parse_dates=["Date"], index_col="Date")
-                self.data[ticker] = df['Close']
+        tickers = list(self.ticker_file_map)
+        filepaths = list(self.ticker_file_map.values())
+        cache_dirs = [self.cache_dir] * len(tickers)
+
+        # Each file is independent I/O plus parsing, so tickers can be loaded concurrently
+        if max_workers is not None and max_workers > 1:
+            executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            with executor_cls(max_workers=max_workers) as executor:
+                results = list(executor.map(load_close_prices, tickers, filepaths, cache_dirs))
+        else:
+            results = list(map(load_close_prices, tickers, filepaths, cache_dirs))
+
+        for ticker, close, error in results:
+            if error is None:
+                self.data[ticker] = close
                 print(f"✔ Data loaded for {ticker}")
-            except Exception as e:
-                print(f" Failed to load data for {ticker}: {e}")
+            else:
+                print(f" Failed to load data for {ticker}: {error}")
 
         if self.data:
-            self.df = pd.DataFrame(self.data)
+            # One outer-joined concat, sorted on dates like the dict-of-Series constructor
+            self.df = pd.concat(list(self.data.values()), axis=1, sort=True)
         else:
             print(" No valid data loaded from CSV files.")
 
@@ -1,11 +1,27 @@
+import re
+import time
+
+import numpy as np
 import pandas as pd
 from textblob import TextBlob
+from textblob._text import EMOTICONS
+from textblob.en import sentiment as pattern_lexicon
 import matplotlib.pyplot as plt
 import seaborn as sns
+from sklearn.feature_extraction.text import CountVectorizer
 
 from datetime import datetime
 import pytz
 
+from src.date_parsing import date_parse_counter, parse_news_dates_memoized
+from src.correlation import bootstrap_correlation, lag_correlation, rolling_correlation
+from src.dedup import map_unique
+from src.news_cache import IncrementalNewsCache, NewsFrameCache
+from src.news_store import is_parquet_dataset, iter_news_chunks, load_news
+from src.sentiment_cache import RowScoreStore, hash_texts, row_ids
+from src.sentiment_scoring import SCORER_VERSION, headline_dedup_counter
+from src.sentiment_server import SentimentClient
+from src.trading_calendar import DEFAULT_MARKET_CLOSE, DEFAULT_MARKET_TIMEZONE, TradingCalendar
 
 
 class SentimentReturnAnalyzer:
@@ -13,67 +29,101 @@ class SentimentReturnAnalyzer:
     A class to analyze the correlation between financial news sentiment and stock returns.
     """
 
-    def __init__(self, news_path, stock_path, stock_symbol):
+    def __init__(self, news_path, stock_path, stock_symbol, news_columns=None, news_frame=None,
+                 cache_dir=None, incremental=False):
         self.news_path = news_path
         self.stock_path = stock_path
         self.stock_symbol = stock_symbol
+        self.news_columns = news_columns
+        self._news_frame = news_frame
+        if incremental and (cache_dir is None or is_parquet_dataset(news_path)):
+            raise ValueError("Incremental ingestion needs a cache_dir and an append-only news CSV")
+        if cache_dir is None:
+            self.cache = None
+        elif incremental:
+            self.cache = IncrementalNewsCache(cache_dir)
+        else:
+            self.cache = NewsFrameCache(cache_dir)
         self.news_df = None
         self.stock_df = None
         self.merged_df = None
+        self.calendar = None
 
     def __repr__(self):
         return f"<SentimentReturnAnalyzer stock={self.stock_symbol} records={len(self.merged_df) if self.merged_df is not None else 0}>"
 
+    @classmethod
+    def for_symbols(cls, news_path, stock_paths, news_columns=None):
+        """Reads the news file once and builds one analyzer per symbol in stock_paths."""
+        news_df = load_news(news_path, list(stock_paths), news_columns)
+        print(f"[Info] Loaded {len(news_df)} news rows for {len(stock_paths)} symbols in one pass")
+
+        # A stable sort keeps each symbol's rows contiguous, so every group is a slice (view)
+        news_df = news_df.sort_values("stock", kind="stable")
+        positions = news_df.groupby("stock", sort=False, observed=True).indices
+
+        analyzers = {}
+        for symbol, stock_path in stock_paths.items():
+            rows = positions.get(symbol)
+            group = news_df.iloc[rows[0]:rows[-1] + 1] if rows is not None else news_df.iloc[0:0]
+            analyzers[symbol] = cls(news_path, stock_path, symbol, news_columns, news_frame=group)
+        return analyzers
+
     def load_data(self):
         """Loads and preprocesses news and stock data."""
         try:
-            self.news_df = pd.read_csv(self.news_path)
+            self.news_df = self._load_news()
             self.stock_df = pd.read_csv(self.stock_path)
-
-            # Normalize column names
-            self.news_df.columns = self.news_df.columns.str.lower()
             self.stock_df.columns = self.stock_df.columns.str.lower()
 
-            # Filter news for the specific stock
-            self.news_df = self.news_df[self.news_df["stock"] == self.stock_symbol]
-
-            # Clean and convert date column in news_df
-            self.news_df["date"] = (
-                self.news_df["date"]
-                .astype(str)
-                .str.strip()
-                .str.replace(r"\s{2,}", " ", regex=True)
-            )
-            self.news_df["date"] = pd.to_datetime(self.news_df["date"], errors="coerce")
-
-                        # Handle unparsed dates with custom parser
-            invalid_mask = self.news_df["date"].isna()
-            if invalid_mask.any():
-                reparsed_values = []
-                for i in self.news_df.loc[invalid_mask].index:
-                    parsed = self.try_parse_custom_date(self.news_df.at[i, "date"])
-                    reparsed_values.append(parsed)
-
-                # Convert the reparsed dates to a proper Series with the right dtype
-                reparsed_series = pd.Series(reparsed_values, index=self.news_df.loc[invalid_mask].index)
-
-                # Ensure 'date' column is naive (no timezone) before assigning
-                self.news_df["date"] = self.news_df["date"].dt.tz_localize(None)
-
-                # Assign the cleaned values
-                self.news_df.loc[invalid_mask, "date"] = reparsed_series
-
             # Clean and parse stock_df date column
             self.stock_df["date"] = pd.to_datetime(self.stock_df["date"], errors="coerce")
+            self.calendar = None
 
             # Debug invalid dates
             invalid_dates = self.news_df[self.news_df["date"].isna()]
-            print(f"[Debug] Unparsed news dates after fallback parsing: {len(invalid_dates)}")
+            print(f"[Debug] Unparsed news dates after format-group parsing: {len(invalid_dates)}")
 
         except Exception as e:
             print(f"[Error] Failed to load and process data: {e}")
             raise
     
+    def _load_news(self):
+        """Returns the cleaned news rows of the symbol, from the cache when it is up to date."""
+        if self._news_frame is not None:
+            # Shallow copy: shares the rows read by for_symbols() instead of re-reading the file
+            return self._clean_news(self._news_frame.copy(deep=False))
+
+        if isinstance(self.cache, IncrementalNewsCache):
+            # Only the rows appended since the last checkpoint are parsed and cleaned
+            return self.cache.load(self.news_path, self.stock_symbol, self._clean_news, self.news_columns)
+
+        if self.cache is not None:
+            cached = self.cache.load(self.news_path, self.stock_symbol, self.news_columns)
+            if cached is not None:
+                print(f"[Info] Loaded cleaned news for {self.stock_symbol} from cache")
+                return cached
+
+        news_df = self._clean_news(load_news(self.news_path, [self.stock_symbol], self.news_columns))
+        if self.cache is not None:
+            self.cache.store(news_df, self.news_path, self.stock_symbol, self.news_columns)
+        return news_df
+
+    def _clean_news(self, news_df):
+        """Normalizes column names, keeps the symbol's rows and parses the date column."""
+        # Normalize column names
+        news_df.columns = news_df.columns.str.lower()
+
+        # Filter news for the specific stock; a news_frame from for_symbols() holds only its rows already
+        if self._news_frame is None:
+            news_df = news_df[news_df["stock"] == self.stock_symbol]
+
+        # Clean and convert date column, parsing each distinct date string once
+        news_df["date"] = parse_news_dates_memoized(news_df["date"])
+        print(f"[Debug] Date parsing: {date_parse_counter.last_unique} unique of {date_parse_counter.last_total} "
+              f"values (ratio {date_parse_counter.last_ratio:.3f})")
+        return news_df
+
     @staticmethod
     def try_parse_custom_date(date_str):
         """Attempts to parse non-standard date strings."""
@@ -83,16 +133,79 @@ class SentimentReturnAnalyzer:
         except Exception:
             return pd.NaT
         
-    def analyze_sentiment(self):
-        """Performs sentiment analysis on news headlines."""
+    def analyze_sentiment(self, engine=None, server_url=None, row_store_path=None, tiered=False):
+        """Performs sentiment analysis on news headlines with the given engine, server, row store or tiered pre-pass."""
+        try:
+            if server_url is not None:
+                engine = SentimentClient(server_url)
+            if tiered:
+                engine = TieredSentimentScorer(engine)
+            if row_store_path is not None:
+                self.news_df["sentiment"] = self._score_new_rows(engine, row_store_path)
+            else:
+                self.news_df["sentiment"] = self._score_headlines(self.news_df["headline"], engine)
+            if tiered:
+                self.tier_report = engine.report
+        except Exception as e:
+            print(f"[Error] Sentiment analysis failed: {e}")
+            raise
+
+    def _score_new_rows(self, engine, row_store_path):
+        """Reuses persisted per-row scores and scores only rows the store has not seen."""
+        store = RowScoreStore(row_store_path, getattr(engine, "scorer_version", SCORER_VERSION))
         try:
-            def get_sentiment(text):
-                return TextBlob(text).sentiment.polarity
+            ids = row_ids(self.news_df)
+            hashes = hash_texts(self.news_df["headline"])
+            polarity, found = store.lookup(ids, hashes)
+            missing = np.flatnonzero(~found)
+            print(f"[Info] Reused stored sentiment for {len(ids) - len(missing)} rows, scoring {len(missing)} new rows")
+            if len(missing):
+                scores = np.asarray(self._score_headlines(self.news_df["headline"].iloc[missing], engine), dtype=float)
+                polarity[missing] = scores
+                store.store([ids[i] for i in missing], [hashes[i] for i in missing], scores)
+            return polarity
+        finally:
+            store.close()
+
+    @staticmethod
+    def _score_headlines(headlines, engine=None):
+        """Returns the polarity of each headline, aligned with the input."""
+        if engine is not None:
+            return engine.polarity(headlines)
+
+        def get_sentiment(text):
+            return TextBlob(text).sentiment.polarity
 
-            self.news_df["sentiment"] = self.news_df["headline"].apply(get_sentiment)
+        # Repeated headlines are scored once and broadcast back through their codes
+        polarity = map_unique(headlines, lambda unique: unique.apply(get_sentiment), headline_dedup_counter)
+        print(f"[Info] Headline dedup ratio: {headline_dedup_counter.last_ratio:.3f}")
+        return polarity
 
+    def iter_scored_news(self, chunksize=100_000, engine=None):
+        """Yields (date, sentiment) frames for the symbol, reading and scoring one chunk of news at a time."""
+        for chunk in iter_news_chunks(self.news_path, [self.stock_symbol], self.news_columns, chunksize):
+            chunk = self._clean_news(chunk)
+            chunk["sentiment"] = self._score_headlines(chunk["headline"], engine)
+            yield chunk[["date", "sentiment"]]
+
+    def stream_daily_sentiment(self, chunksize=100_000, engine=None):
+        """Builds the aggregate_sentiment() frame without holding more than one chunk of news rows.
+
+        Each scored chunk is folded into running per-date sum and count accumulators.
+        The result can be passed to merge_data(daily_sentiment=...).
+        """
+        try:
+            totals = None
+            for scored in self.iter_scored_news(chunksize, engine):
+                daily = scored.groupby("date")["sentiment"].agg(["sum", "count"])
+                totals = daily if totals is None else totals.add(daily, fill_value=0)
+
+            if totals is None:
+                return pd.DataFrame({"date": pd.Series(dtype="datetime64[ns]"), "sentiment": pd.Series(dtype=float)})
+            mean = (totals["sum"] / totals["count"]).sort_index()
+            return mean.rename("sentiment").rename_axis("date").reset_index()
         except Exception as e:
-            print(f"[Error] Sentiment analysis failed: {e}")
+            print(f"[Error] Failed to stream daily sentiment: {e}")
             raise
 
     def aggregate_sentiment(self):
@@ -112,10 +225,16 @@ class SentimentReturnAnalyzer:
             print(f"[Error] Failed to compute daily returns: {e}")
             raise
 
-    def merge_data(self):
-        """Merges sentiment and return data on the date column."""
+    def merge_data(self, daily_sentiment=None, align_sessions=False, market_close=DEFAULT_MARKET_CLOSE,
+                   timezone=DEFAULT_MARKET_TIMEZONE, news_timezone=None):
+        """Merges sentiment and return data on the date column, optionally aligned to trading sessions."""
         try:
-            daily_sentiment = self.aggregate_sentiment()
+            if align_sessions:
+                sentiment = self.news_df if daily_sentiment is None else daily_sentiment
+                daily_sentiment = self.align_to_sessions(sentiment, market_close, timezone, news_timezone)
+            elif daily_sentiment is None:
+                daily_sentiment = self.aggregate_sentiment()
+            daily_sentiment = daily_sentiment.copy()
 
             self.stock_df["date"] = self.stock_df["date"].dt.normalize()
             daily_sentiment["date"] = pd.to_datetime(daily_sentiment["date"]).dt.normalize()
@@ -136,16 +255,99 @@ class SentimentReturnAnalyzer:
             print(f"[Error] Failed to merge sentiment and stock return data: {e}")
             raise
 
-    def compute_correlation(self):
-        """Computes Pearson correlation between sentiment and stock returns."""
+    def align_to_sessions(self, sentiment, market_close=DEFAULT_MARKET_CLOSE, timezone=DEFAULT_MARKET_TIMEZONE,
+                          news_timezone=None):
+        """Averages sentiment per effective trading session.
+
+        sentiment holds date and sentiment columns: news rows, or the per-timestamp means of
+        stream_daily_sentiment() (which are then averaged with equal weight). The trading
+        days come from the loaded price history and are computed once per load_data().
+        """
+        try:
+            if self.calendar is None:
+                self.calendar = TradingCalendar.from_prices(self.stock_df)
+            sessions = self.calendar.sessions(sentiment["date"], market_close, timezone, news_timezone)
+
+            published = pd.to_datetime(sentiment["date"]).dt.normalize().to_numpy(dtype="datetime64[ns]")
+            unmatched = np.isnat(sessions)
+            moved = ~unmatched & (sessions != published)
+            print(f"[Info] Aligned {len(sessions)} news timestamps to trading sessions: "
+                  f"{int(moved.sum())} moved to a later session, {int(unmatched.sum())} after the last session")
+
+            aligned = pd.DataFrame({"date": sessions, "sentiment": np.asarray(sentiment["sentiment"], dtype=float)})
+            return aligned.groupby("date")["sentiment"].mean().reset_index()
+        except Exception as e:
+            print(f"[Error] Failed to align news to trading sessions: {e}")
+            raise
+
+    def compute_correlation(self, n_bootstrap=None, confidence=0.95, block_length=None, workers=None, seed=None):
+        """Computes Pearson correlation between sentiment and stock returns, with an optional bootstrap CI."""
         try:
             corr = self.merged_df["sentiment"].corr(self.merged_df["daily_return"])
             print(f"[Info] Pearson correlation: {corr:.4f}")
+            if n_bootstrap:
+                # Blocks are drawn over trading sessions, so block_length counts sessions rather than news days
+                sentiment, returns = self._session_series()
+                self.correlation_ci = bootstrap_correlation(
+                    sentiment, returns, n_bootstrap, confidence, block_length, seed, workers,
+                )
+                print(f"[Info] {confidence:.0%} bootstrap CI ({n_bootstrap} resamples): "
+                      f"[{self.correlation_ci['ci_low']:.4f}, {self.correlation_ci['ci_high']:.4f}]")
             return corr
         except Exception as e:
             print(f"[Error] Failed to compute correlation: {e}")
             raise
 
+    def _session_series(self):
+        """Daily sentiment and returns on every trading session of the price history.
+
+        Sessions without news keep their return and get NaN sentiment, so windows and lags
+        are counted in sessions rather than in days with news.
+        """
+        daily = self.merged_df.groupby("date")["sentiment"].mean()
+        returns = self.stock_df.groupby(self.stock_df["date"].dt.normalize())["daily_return"].first()
+        return daily.reindex(returns.index).rename(self.stock_symbol), returns.rename(self.stock_symbol)
+
+    def compute_rolling_correlation(self, windows=(20, 60, 120), min_periods=10):
+        """Computes the sentiment/return correlation over trailing windows of trading days.
+
+        Windows slide over every session of the price history; sessions without news are
+        skipped by the running sums, and a window needs min_periods sessions with news
+        (None requires the full window). One column per window length; see
+        correlation.rolling_correlation. The result is indexed by date and kept in self.rolling_corr.
+        """
+        try:
+            sentiment, returns = self._session_series()
+            self.rolling_corr = rolling_correlation(sentiment, returns, windows, min_periods)
+            # Each window reports its last defined value together with the session it belongs to
+            latest = []
+            for name, column in self.rolling_corr.items():
+                last = column.last_valid_index()
+                latest.append(f"{name}=n/a" if last is None else f"{name}={column[last]:.4f} ({last:%Y-%m-%d})")
+            print(f"[Info] Rolling correlation computed for windows {list(windows)}; latest: " + ", ".join(latest))
+            return self.rolling_corr
+        except Exception as e:
+            print(f"[Error] Failed to compute rolling correlation: {e}")
+            raise
+
+    def compute_lag_correlation(self, max_lag=10, min_lag=None):
+        """Correlates sentiment with the returns of later (positive lag) or earlier sessions.
+
+        Sentiment is placed on every trading session of the price history (NaN on sessions
+        without news) so that a lag of k is k sessions; see correlation.lag_correlation.
+        The profile is indexed by lag and kept in self.lag_corr.
+        """
+        try:
+            sentiment, returns = self._session_series()
+            self.lag_corr = lag_correlation(sentiment, returns, max_lag, min_lag)
+            profile = self.lag_corr[self.stock_symbol]
+            best = profile.abs().idxmax() if profile.notna().any() else None
+            print(f"[Info] Strongest sentiment/return correlation at lag {best}")
+            return self.lag_corr
+        except Exception as e:
+            print(f"[Error] Failed to compute lag correlation: {e}")
+            raise
+
     def plot_relationship(self):
         """Visualizes the sentiment vs. daily return relationship."""
         try:
@@ -171,4 +373,159 @@ class SentimentReturnAnalyzer:
             plt.show()
         except Exception as e:
             print(f"[Error] Failed to plot correlation heatmap: {e}")
-            raise    
\ No newline at end of file
+            raise
+
+
+class LexiconPolarityScorer:
+    """
+    Approximates TextBlob polarity with a sparse document-term matrix and one matrix-vector product.
+
+    Headlines are tokenized in a single CountVectorizer pass restricted to the single-word
+    entries of TextBlob's pattern lexicon; a headline's polarity is the mean lexicon polarity
+    of the words it contains (0.0 without hits). Unlike TextBlob, intensifiers ("very"),
+    negations ("not"), exclamation marks and emoticons are ignored, so use
+    lexicon_agreement_report() to check the trade-off before a backfill.
+    """
+
+    scorer_version = "pattern-lexicon-sparse-v1"
+
+    # Words with inner apostrophes, hyphens or asterisks stay one token ("mind-boggling", "f*cking")
+    TOKEN_PATTERN = r"(?u)\w+(?:['*-]\w+)*"
+
+    def __init__(self):
+        self.vocabulary = [word for word in pattern_lexicon.keys() if " " not in word]
+        self.weights = np.array([pattern_lexicon[word][None][0] for word in self.vocabulary])
+        self.vectorizer = CountVectorizer(vocabulary=self.vocabulary, token_pattern=self.TOKEN_PATTERN)
+
+    def __repr__(self):
+        return f"<LexiconPolarityScorer words={len(self.vocabulary)}>"
+
+    def transform(self, texts):
+        """Returns the sparse (headlines x lexicon words) count matrix."""
+        return self.vectorizer.transform(pd.Series(texts, dtype=object).fillna(""))
+
+    def polarity(self, texts):
+        """Returns the mean lexicon polarity of each headline."""
+        counts = self.transform(texts)
+        hits = np.asarray(counts.sum(axis=1)).ravel().astype(float)
+        total = counts @ self.weights
+        return np.divide(total, hits, out=np.zeros_like(total), where=hits > 0)
+
+
+class TieredSentimentScorer:
+    """
+    Scores headlines in two tiers: a vectorized lexicon pre-pass, then full TextBlob scoring.
+
+    TextBlob only gives a non-zero polarity to headlines containing a lexicon word, an
+    emoticon or "(!)". The pre-pass looks for those with a superset test: plain lexicon
+    words against every run of word characters, hyphenated or contracted entries as
+    bounded substrings, and emoticons as substrings of the headline with its whitespace
+    removed, because TextBlob's tokenizer joins spaced emoticons (": D" becomes ":d").
+    Headlines it sets to 0.0 therefore get 0.0 from TextBlob too; tiered_mismatches()
+    checks that on a sample. The remaining headlines are passed to engine (or the default
+    serial path). Tier counts and timings accumulate in self.report.
+    """
+
+    # The pattern tokenizer never emits a token spanning several runs of word characters
+    # except for entries like "mind-boggling", which are matched as a whole below
+    PIECE_PATTERN = r"(?u)\w+"
+
+    def __init__(self, engine=None):
+        self.engine = engine
+        words = [word for word in pattern_lexicon.keys() if " " not in word]
+        self.words = {word for word in words if re.fullmatch(self.PIECE_PATTERN, word)}
+        compounds = [re.escape(word) for word in words if word not in self.words]
+        self.compounds = re.compile(r"(?<!\w)(?:%s)(?!\w)" % "|".join(compounds))
+        markers = {emoticon.lower() for group in EMOTICONS.values() for emoticon in group} | {"(!)"}
+        self.markers = re.compile("|".join(map(re.escape, sorted(markers, key=len, reverse=True))))
+        self.report = {"rows": 0, "zero_rows": 0, "full_rows": 0, "prefilter_seconds": 0.0,
+                       "full_seconds": 0.0, "seconds_saved": 0.0}
+
+    def __repr__(self):
+        return f"<TieredSentimentScorer engine={self.engine!r}>"
+
+    # Part of scorer_version; bump when the pre-pass changes so stores it filled are cleared
+    PREFILTER_VERSION = "tiered-v2"
+
+    @property
+    def scorer_version(self):
+        return f"{getattr(self.engine, 'scorer_version', SCORER_VERSION)}+{self.PREFILTER_VERSION}"
+
+    def needs_full_scoring(self, texts):
+        """Returns a boolean mask of headlines that may have a non-zero TextBlob polarity."""
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+        is_text = texts.map(lambda text: isinstance(text, str)).to_numpy(dtype=bool)
+        lowered = texts.where(is_text, "").str.lower()
+
+        pieces = lowered.str.findall(self.PIECE_PATTERN).explode()
+        hits = pieces.isin(self.words).groupby(level=0).any().reindex(texts.index, fill_value=False)
+        hits = hits.to_numpy(dtype=bool, copy=True)
+        # Compound entries always contain an apostrophe, hyphen or asterisk
+        joined = lowered.str.contains(r"['*-]", regex=True).to_numpy(dtype=bool)
+        hits[joined] |= lowered[joined].str.contains(self.compounds).to_numpy(dtype=bool)
+        markers = lowered.str.replace(r"\s+", "", regex=True).str.contains(self.markers).to_numpy(dtype=bool)
+        # Missing headlines go to the full scorer so they fail exactly as they would there
+        return hits | markers | ~is_text
+
+    def polarity(self, texts):
+        """Returns the TextBlob polarity of each headline, scoring only those the pre-pass flags."""
+        texts = pd.Series(texts, dtype=object).reset_index(drop=True)
+        start = time.perf_counter()
+        full = self.needs_full_scoring(texts)
+        prefilter_seconds = time.perf_counter() - start
+
+        polarity = np.zeros(len(texts))
+        full_rows = int(full.sum())
+        start = time.perf_counter()
+        if full_rows:
+            scored = SentimentReturnAnalyzer._score_headlines(texts[full], self.engine)
+            polarity[full] = np.asarray(scored, dtype=float)
+        full_seconds = time.perf_counter() - start
+
+        # The skipped rows would have cost about as much per row as the ones that were scored
+        zero_rows = len(texts) - full_rows
+        saved = zero_rows * full_seconds / full_rows - prefilter_seconds if full_rows else 0.0
+        report = self.report
+        report["rows"] += len(texts)
+        report["zero_rows"] += zero_rows
+        report["full_rows"] += full_rows
+        report["prefilter_seconds"] += prefilter_seconds
+        report["full_seconds"] += full_seconds
+        report["seconds_saved"] += saved
+        print(f"[Info] Tiered scoring: {zero_rows} rows set to 0.0 by the lexicon pre-pass, "
+              f"{full_rows} rows fully scored; about {saved:.2f}s saved")
+        return polarity
+
+
+def tiered_mismatches(headlines, scorer=None):
+    """Returns the headlines whose tiered polarity differs from full TextBlob scoring (expected empty)."""
+    headlines = pd.Series(headlines, dtype=object).reset_index(drop=True)
+    reference = headlines.apply(lambda text: TextBlob(text).sentiment.polarity).to_numpy(dtype=float)
+    tiered = (scorer or TieredSentimentScorer()).polarity(headlines)
+    differs = ~np.isclose(tiered, reference)
+    return pd.DataFrame({"headline": headlines[differs], "tiered": tiered[differs], "textblob": reference[differs]})
+
+
+def lexicon_agreement_report(headlines, reference=None, scorer=None):
+    """Compares LexiconPolarityScorer with TextBlob polarity on the given headlines.
+
+    reference can hold already computed TextBlob polarities (e.g. news_df["sentiment"]);
+    otherwise they are computed here.
+    """
+    headlines = pd.Series(headlines).reset_index(drop=True)
+    if reference is None:
+        reference = headlines.apply(lambda text: TextBlob(text).sentiment.polarity)
+    reference = np.asarray(reference, dtype=float)
+    approx = (scorer or LexiconPolarityScorer()).polarity(headlines)
+
+    report = {
+        "rows": len(headlines),
+        "pearson": float(np.corrcoef(approx, reference)[0, 1]) if len(headlines) > 1 else np.nan,
+        "mean_abs_error": float(np.mean(np.abs(approx - reference))),
+        "sign_agreement": float(np.mean(np.sign(approx) == np.sign(reference))),
+        "exact_match_share": float(np.mean(np.isclose(approx, reference))),
+    }
+    print("[Info] Lexicon vs TextBlob polarity: "
+          f"pearson={report['pearson']:.4f} mae={report['mean_abs_error']:.4f} "
+          f"sign agreement={report['sign_agreement']:.1%} exact={report['exact_match_share']:.1%}")
+    return report
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH = 500
+
+
+def _text_bytes(text):
+    # Non-string values (missing headlines) get a prefix no real headline starts with
+    return text.encode("utf-8") if isinstance(text, str) else b"\x00" + repr(text).encode()
+
+
+def hash_texts(texts):
+    """16-byte BLAKE2b digest of each headline."""
+    return [hashlib.blake2b(_text_bytes(text), digest_size=16).digest() for text in texts]
+
+
+class _VersionedStore:
+    """
+    SQLite table of scores tagged with the version of the scorer that produced them.
+
+    Opening the store with a different scorer version clears the table.
+    """
+
+    TABLE = None
+    SCHEMA = None
+    PLACEHOLDERS = None
+
+    def __init__(self, path, scorer_version):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.scorer_version = scorer_version
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self.TABLE} {self.SCHEMA} WITHOUT ROWID")
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'scorer_version'").fetchone()
+        if row is None or row[0] != scorer_version:
+            if row is not None:
+                print(f"[Info] Scorer changed from {row[0]} to {scorer_version}; clearing {self.path}")
+            self._conn.execute(f"DELETE FROM {self.TABLE}")
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('scorer_version', ?)", (scorer_version,))
+        self._conn.commit()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} path={self.path} version={self.scorer_version}>"
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+
+    def close(self):
+        """Closes the database connection."""
+        self._conn.close()
+
+    def _select(self, key_column, columns, keys):
+        """Yields the stored rows of the given keys, querying in parameter-limited batches."""
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[start:start + _LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                yield from self._conn.execute(
+                    f"SELECT {key_column}, {columns} FROM {self.TABLE} WHERE {key_column} IN ({placeholders})",
+                    batch,
+                )
+
+    def _insert(self, rows):
+        with self._lock:
+            self._conn.executemany(f"INSERT OR REPLACE INTO {self.TABLE} VALUES ({self.PLACEHOLDERS})", rows)
+            self._conn.commit()
+
+
+class SentimentCache(_VersionedStore):
+    """
+    Persistent headline-hash -> (polarity, subjectivity) store backed by SQLite.
+
+    The cache remembers the version of the scorer that filled it; opening it with a
+    different version clears every stored score.
+    """
+
+    TABLE = "scores"
+    SCHEMA = "(hash BLOB PRIMARY KEY, polarity REAL, subjectivity REAL)"
+    PLACEHOLDERS = "?, ?, ?"
+
+    def lookup(self, hashes):
+        """Returns (polarity, subjectivity, found) arrays aligned with hashes; misses are NaN."""
+        index = {}
+        for i, digest in enumerate(hashes):
+            index.setdefault(digest, []).append(i)
+        scores = np.full((len(hashes), 2), np.nan)
+        found = np.zeros(len(hashes), dtype=bool)
+
+        for digest, polarity, subjectivity in self._select("hash", "polarity, subjectivity", list(index)):
+            positions = index[digest]
+            scores[positions] = (polarity, subjectivity)
+            found[positions] = True
+        return scores[:, 0], scores[:, 1], found
+
+    def store(self, hashes, polarity, subjectivity):
+        """Saves the scores of the given headline hashes."""
+        self._insert(zip(hashes, map(float, polarity), map(float, subjectivity)))
+
+
+def row_ids(news_df):
+    """Stable identity of each news row.
+
+    Uses the CSV's unnamed index column when present, otherwise a hash of the
+    row's headline, publication date and stock.
+    """
+    if "unnamed: 0" in news_df.columns:
+        return [f"row:{value}" for value in news_df["unnamed: 0"]]
+    content = (
+        news_df["headline"].astype(str) + "\x1f" + news_df["date"].astype(str) + "\x1f" + news_df["stock"].astype(str)
+    )
+    return ["sha:" + digest.hex() for digest in hash_texts(content)]
+
+
+class RowScoreStore(_VersionedStore):
+    """
+    Persists the polarity computed for each news row, keyed by its stable row id.
+
+    A stored score is only reused while the row's headline hash is unchanged, so edited
+    rows are scored again.
+    """
+
+    TABLE = "row_scores"
+    SCHEMA = "(row_id TEXT PRIMARY KEY, text_hash BLOB, polarity REAL)"
+    PLACEHOLDERS = "?, ?, ?"
+
+    def lookup(self, ids, hashes):
+        """Returns (polarity, found) arrays aligned with ids; rows without a valid score are NaN."""
+        # Content-hash ids repeat for identical (headline, date, stock) rows; all copies share the score
+        positions = {}
+        for i, row_id in enumerate(ids):
+            positions.setdefault(row_id, []).append(i)
+        polarity = np.full(len(ids), np.nan)
+        found = np.zeros(len(ids), dtype=bool)
+        for row_id, text_hash, score in self._select("row_id", "text_hash, polarity", list(positions)):
+            for i in positions[row_id]:
+                if text_hash == hashes[i]:
+                    polarity[i] = score
+                    found[i] = True
+        return polarity, found
+
+    def store(self, ids, hashes, polarity):
+        """Saves the polarity of the given rows."""
+        self._insert(zip(ids, hashes, map(float, polarity)))
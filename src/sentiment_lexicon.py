@@ -0,0 +1,71 @@
+import os
+import pickle
+import time
+from importlib.metadata import version
+
+from textblob import TextBlob
+from textblob.en import sentiment as pattern_lexicon
+
+from src.cache_utils import atomic_write
+
+# Artifacts compiled under another TextBlob release are ignored and rebuilt
+LEXICON_VERSION = f"textblob-{version('textblob')}"
+
+
+def _is_loaded():
+    # lazydict parses the XML on first access; dict.__len__ checks without triggering it
+    return dict.__len__(pattern_lexicon) > 0
+
+
+def compile_lexicon(path):
+    """Parses TextBlob's sentiment lexicon once and pickles the parsed tables to path."""
+    len(pattern_lexicon)  # triggers the XML parse if it has not happened yet
+    artifact = {
+        "lexicon_version": LEXICON_VERSION,
+        "words": dict(pattern_lexicon),
+        "labeler": dict(pattern_lexicon.labeler),
+        "synsets": dict(pattern_lexicon._synsets),
+        "language": pattern_lexicon._language,
+    }
+    with atomic_write(path) as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"[Info] Compiled sentiment lexicon ({len(artifact['words'])} words) to {path}")
+
+
+def preload_lexicon(path=None):
+    """Fills TextBlob's lexicon from a compiled artifact, or from the XML when there is none.
+
+    Used as the process pool initializer, so each worker is warm before its first chunk.
+    A missing artifact or one compiled for another TextBlob version falls back to the XML.
+    """
+    if _is_loaded():
+        return
+    if path is not None and os.path.exists(path):
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+        if artifact["lexicon_version"] == LEXICON_VERSION:
+            # dict.update bypasses lazydict, which would otherwise parse the XML first
+            dict.update(pattern_lexicon.labeler, artifact["labeler"])
+            dict.update(pattern_lexicon._synsets, artifact["synsets"])
+            pattern_lexicon._language = artifact["language"]
+            dict.update(pattern_lexicon, artifact["words"])
+            return
+        print(f"[Info] Lexicon artifact {path} was built for {artifact['lexicon_version']}; loading the XML")
+    len(pattern_lexicon)
+
+
+def ensure_lexicon(path):
+    """Compiles the lexicon artifact at path unless an up-to-date one exists."""
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if pickle.load(f)["lexicon_version"] == LEXICON_VERSION:
+                return
+    compile_lexicon(path)
+
+
+def cold_start_seconds(path=None):
+    """Times the first TextBlob score in this process, after preloading from path when given."""
+    start = time.perf_counter()
+    preload_lexicon(path)
+    TextBlob("good").sentiment
+    return time.perf_counter() - start
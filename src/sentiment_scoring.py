@@ -0,0 +1,128 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
+
+import numpy as np
+import pandas as pd
+from textblob import TextBlob
+
+from src.dedup import UniqueCounter
+from src.sentiment_cache import SentimentCache, hash_texts
+from src.sentiment_lexicon import ensure_lexicon, preload_lexicon
+
+# Identifies the scoring model; caches filled by a different scorer are invalidated
+SCORER_VERSION = f"textblob-{version('textblob')}-PatternAnalyzer"
+
+# Shared across engines and analyzers so the TextBlob calls saved by deduplication can be inspected
+headline_dedup_counter = UniqueCounter("headlines")
+
+
+def score_headlines(texts):
+    """Scores a batch of headlines with TextBlob, returning an (n, 2) array of polarity and subjectivity."""
+    scores = np.empty((len(texts), 2))
+    for i, text in enumerate(texts):
+        scores[i] = TextBlob(text).sentiment
+    return scores
+
+
+class SentimentEngine:
+    """
+    Scores headlines with TextBlob in fixed-size chunks spread over a process pool.
+
+    Chunks are mapped in order, so results line up with the input and are identical
+    to scoring every headline serially. The pool is created on first use and reused
+    until close() is called (or the engine is used as a context manager).
+
+    Repeated headlines are scored once: texts are factorized, only the unique texts are
+    scored and the results are broadcast back through the integer codes. With cache_path,
+    scores are looked up in a persistent SentimentCache first and only headlines the cache
+    has not seen are sent to TextBlob.
+
+    Workers start with TextBlob's lexicon already parsed: the parent loads it before the
+    pool is created, so forked workers inherit it, and with lexicon_path every worker
+    otherwise loads a pickled copy (compiled on first use) instead of parsing the XML.
+    """
+
+    scorer_version = SCORER_VERSION
+
+    def __init__(self, workers=None, chunksize=5_000, cache_path=None, dedup=True, lexicon_path=None):
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.chunksize = chunksize
+        self.dedup = dedup
+        self.lexicon_path = lexicon_path
+        self.cache = SentimentCache(cache_path, SCORER_VERSION) if cache_path is not None else None
+        self._executor = None
+
+    def __repr__(self):
+        return f"<SentimentEngine workers={self.workers} chunksize={self.chunksize}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Creates the worker pool now instead of on first use, with every worker started."""
+        if self._executor is None:
+            self._executor = self._start_pool()
+            list(self._executor.map(score_headlines, [[""]] * self.workers))
+
+    def close(self):
+        """Shuts down the worker pool and closes the cache."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self.cache is not None:
+            self.cache.close()
+
+    def score(self, texts):
+        """Returns (polarity, subjectivity) arrays for the given headlines, in input order."""
+        texts = list(texts)
+        if not self.dedup:
+            return self._score_cached(texts)
+
+        codes, uniques = pd.factorize(np.asarray(texts, dtype=object), use_na_sentinel=False)
+        headline_dedup_counter.record(len(codes), len(uniques))
+        print(f"[Info] Scoring {len(uniques)} unique of {len(codes)} headlines "
+              f"(dedup ratio {len(uniques) / max(len(codes), 1):.3f})")
+        polarity, subjectivity = self._score_cached(list(uniques))
+        return polarity[codes], subjectivity[codes]
+
+    def _score_cached(self, texts):
+        if self.cache is None:
+            return self._score_batches(texts)
+
+        hashes = hash_texts(texts)
+        polarity, subjectivity, found = self.cache.lookup(hashes)
+        missing = np.flatnonzero(~found)
+        print(f"[Info] Sentiment cache hits: {len(texts) - len(missing)}/{len(texts)}")
+        if len(missing):
+            new_polarity, new_subjectivity = self._score_batches([texts[i] for i in missing])
+            polarity[missing] = new_polarity
+            subjectivity[missing] = new_subjectivity
+            self.cache.store([hashes[i] for i in missing], new_polarity, new_subjectivity)
+        return polarity, subjectivity
+
+    def _start_pool(self):
+        if self.lexicon_path is not None:
+            ensure_lexicon(self.lexicon_path)
+        preload_lexicon(self.lexicon_path)
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=preload_lexicon, initargs=(self.lexicon_path,)
+        )
+
+    def _score_batches(self, texts):
+        chunks = [texts[i:i + self.chunksize] for i in range(0, len(texts), self.chunksize)]
+        if self.workers > 1 and len(chunks) > 1:
+            self.start()
+            results = list(self._executor.map(score_headlines, chunks))
+        else:
+            results = [score_headlines(chunk) for chunk in chunks]
+
+        scores = np.concatenate(results) if results else np.empty((0, 2))
+        return scores[:, 0], scores[:, 1]
+
+    def polarity(self, texts):
+        """Returns the TextBlob polarity of each headline, in input order."""
+        return self.score(texts)[0]
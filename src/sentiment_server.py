@@ -0,0 +1,220 @@
+"""Local HTTP service that scores headline batches for several notebooks with one shared engine.
+
+Usage (from the project root):
+    python -m src.sentiment_server --port 8765 --workers 8 --cache-path cache/sentiment.sqlite
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from src.sentiment_scoring import SCORER_VERSION, SentimentEngine
+
+DEFAULT_URL = "http://127.0.0.1:8765"
+
+
+class _ScoreRequest:
+    def __init__(self, texts):
+        self.texts = texts
+        self.future = Future()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok", "engine": repr(self.server.scorer.engine)})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/score":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            polarity = self.server.scorer.submit(payload["headlines"]).result()
+            self._send_json(200, {"polarity": polarity})
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+
+    def log_message(self, format, *args):
+        # Keep notebook/server consoles quiet; failures are reported in the response body
+        pass
+
+
+class SentimentServer:
+    """
+    Scores headline batches posted to /score with a shared SentimentEngine.
+
+    Requests arriving within max_wait seconds of each other are coalesced by a single
+    batcher thread into one engine call of up to max_batch headlines, so concurrent
+    kernels share the worker pool, the cache and the TextBlob warm-up.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8765, engine=None, max_batch=50_000, max_wait=0.02):
+        self.engine = engine if engine is not None else SentimentEngine()
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.scorer = self
+        self._threads = []
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def submit(self, texts):
+        """Queues headlines for the next batch and returns a Future of their polarity list."""
+        request = _ScoreRequest(list(texts))
+        self._queue.put(request)
+        return request.future
+
+    def _next_batch(self):
+        try:
+            pending = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        size = len(pending[0].texts)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.append(request)
+            size += len(request.texts)
+        return pending
+
+    def _run_batcher(self):
+        while not self._stopped.is_set():
+            pending = self._next_batch()
+            if not pending:
+                continue
+            texts = [text for request in pending for text in request.texts]
+            try:
+                polarity = self.engine.polarity(texts).tolist()
+            except Exception:
+                # Score the requests one by one so a bad headline only fails its own request
+                for request in pending:
+                    try:
+                        request.future.set_result(self.engine.polarity(request.texts).tolist())
+                    except Exception as e:
+                        request.future.set_exception(e)
+                continue
+            start = 0
+            for request in pending:
+                stop = start + len(request.texts)
+                request.future.set_result(polarity[start:stop])
+                start = stop
+
+    def start(self):
+        """Serves in background threads, e.g. from a notebook; returns self."""
+        self._threads = [
+            threading.Thread(target=self._run_batcher, daemon=True),
+            threading.Thread(target=self._httpd.serve_forever, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        print(f"[Info] Sentiment server listening on {self.url}")
+        return self
+
+    def serve_forever(self):
+        """Serves in the foreground until interrupted."""
+        self.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        """Stops serving and closes the engine."""
+        self._stopped.set()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        for thread in self._threads:
+            thread.join()
+        self.engine.close()
+
+
+class SentimentClient:
+    """
+    Sends headlines to a running SentimentServer; usable wherever a SentimentEngine is accepted.
+    """
+
+    scorer_version = SCORER_VERSION
+
+    def __init__(self, url=DEFAULT_URL, batch_size=10_000, timeout=600):
+        self.url = url.rstrip("/")
+        self.batch_size = batch_size
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"<SentimentClient url={self.url}>"
+
+    def _post(self, texts):
+        body = json.dumps({"headlines": texts}).encode()
+        request = urllib.request.Request(
+            f"{self.url}/score", data=body, headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())["polarity"]
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"Sentiment server error: {json.loads(e.read())['error']}") from e
+
+    def polarity(self, texts):
+        """Returns the polarity of each headline as scored by the server, in input order."""
+        # Missing headlines are sent as null and rejected by the scorer, like in the serial path
+        texts = [text if isinstance(text, str) else None for text in texts]
+        results = []
+        for start in range(0, len(texts), self.batch_size):
+            results.extend(self._post(texts[start:start + self.batch_size]))
+        return np.asarray(results, dtype=float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="Scoring processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=5_000, help="Headlines per worker task")
+    parser.add_argument("--cache-path", default=None, help="SQLite sentiment cache shared by all clients")
+    parser.add_argument("--lexicon-path", default=None, help="Compiled TextBlob lexicon loaded by every worker")
+    parser.add_argument("--max-batch", type=int, default=50_000, help="Largest coalesced batch")
+    parser.add_argument("--max-wait-ms", type=float, default=20, help="How long to wait for more requests")
+    args = parser.parse_args()
+
+    engine = SentimentEngine(
+        workers=args.workers, chunksize=args.chunksize, cache_path=args.cache_path, lexicon_path=args.lexicon_path
+    )
+    SentimentServer(
+        args.host, args.port, engine, max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
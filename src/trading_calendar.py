@@ -0,0 +1,66 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+# US equity sessions close at 16:00 New York time
+DEFAULT_MARKET_CLOSE = "16:00"
+DEFAULT_MARKET_TIMEZONE = "America/New_York"
+
+
+def _close_offset(market_close):
+    """Time of day of the close as a Timedelta; accepts "HH:MM" strings and datetime.time."""
+    if isinstance(market_close, str):
+        market_close = datetime.datetime.strptime(market_close, "%H:%M").time()
+    return pd.Timedelta(hours=market_close.hour, minutes=market_close.minute, seconds=market_close.second)
+
+
+class TradingCalendar:
+    """
+    Sorted array of trading days, used to map news timestamps to the session they can affect.
+
+    Build it once from the price history (its dates are exactly the sessions that traded,
+    holidays included) and reuse it for every alignment.
+    """
+
+    def __init__(self, trading_days):
+        days = pd.DatetimeIndex(pd.to_datetime(trading_days)).dropna()
+        if days.tz is not None:
+            days = days.tz_localize(None)
+        self.days = np.unique(days.normalize().to_numpy(dtype="datetime64[ns]"))
+
+    def __repr__(self):
+        if not len(self.days):
+            return "<TradingCalendar sessions=0>"
+        return f"<TradingCalendar sessions={len(self.days)} {str(self.days[0])[:10]}..{str(self.days[-1])[:10]}>"
+
+    @classmethod
+    def from_prices(cls, stock_df, date_column="date"):
+        """Builds the calendar from the dates of a price frame."""
+        return cls(stock_df[date_column])
+
+    def sessions(self, timestamps, market_close=DEFAULT_MARKET_CLOSE, timezone=DEFAULT_MARKET_TIMEZONE,
+                 news_timezone=None):
+        """Returns the trading session of each timestamp as datetime64[ns] (NaT past the last session).
+
+        News at or after the close counts towards the next session; news on weekends and
+        holidays towards the first session after them. Tz-aware timestamps are converted to
+        the market timezone; naive ones are taken as market-local wall-clock times unless
+        news_timezone says where they were recorded. Each timestamp costs one binary search
+        over the calendar (O(n log m)).
+        """
+        timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps))
+        if timestamps.tz is None and news_timezone is not None:
+            timestamps = timestamps.tz_localize(news_timezone, ambiguous="NaT", nonexistent="shift_forward")
+        if timestamps.tz is not None:
+            timestamps = timestamps.tz_convert(timezone).tz_localize(None)
+
+        # Shifting by the time left until midnight moves after-close news onto the next day
+        shifted = timestamps + (pd.Timedelta(days=1) - _close_offset(market_close))
+        days = shifted.normalize().to_numpy(dtype="datetime64[ns]")
+
+        positions = np.searchsorted(self.days, days, side="left")
+        valid = (positions < len(self.days)) & ~np.isnat(days)
+        sessions = np.full(len(days), np.datetime64("NaT"), dtype="datetime64[ns]")
+        sessions[valid] = self.days[positions[valid]]
+        return sessions